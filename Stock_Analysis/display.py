@@ -0,0 +1,24 @@
+TREND_LABELS = ('Drop', 'Rise')
+TREND_COLORS = ('#e74c3c', '#27ae60')
+RSI_LABELS = ('Overbought', 'Normal', 'Oversold')
+RSI_COLORS = ('#e74c3c', '#2c3e50', '#27ae60')
+
+PRICE_LAYOUT = dict(
+    title='Closing Price and Moving Averages',
+    xaxis_title='Date',
+    yaxis_title='Price (TL)',
+    template='plotly_white'
+)
+RSI_LAYOUT = dict(
+    title='Relative Strength Index (RSI)',
+    yaxis_range=[0, 100],
+    xaxis_title='Date',
+    yaxis_title='RSI',
+    template='plotly_white'
+)
+VOL_LAYOUT = dict(
+    title='Trading Volume Over Time',
+    xaxis_title='Date',
+    yaxis_title='Volume',
+    template='plotly_white'
+)
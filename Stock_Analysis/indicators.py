@@ -0,0 +1,73 @@
+import numpy as np
+from numba import njit
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    import talib
+    _HAS_TALIB = True
+except ImportError:
+    _HAS_TALIB = False
+
+try:
+    import bottleneck as bn
+    _HAS_BN = True
+except ImportError:
+    _HAS_BN = False
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    window = int(window)
+    if _HAS_TALIB:
+        return talib.SMA(np.ascontiguousarray(values, dtype=np.float64), timeperiod=window)
+    if window > values.shape[0]:
+        return np.full(values.shape[0], np.nan, dtype=values.dtype)
+    if _HAS_BN:
+        # move_mean keeps its running sum in the input dtype, so sum in float64
+        return bn.move_mean(values.astype(np.float64), window=window,
+                            min_count=window).astype(values.dtype, copy=False)
+    out = np.full(values.shape[0], np.nan, dtype=values.dtype)
+    out[window - 1:] = sliding_window_view(values, window).mean(axis=1)
+    return out
+
+# Compiled eagerly from the signature; kept out of the rerun script so this happens once
+@njit('float64[:](float64[:], int64)', cache=True, fastmath=True, boundscheck=False)
+def _rsi_numba(close: np.ndarray, period: int) -> np.ndarray:
+    n = close.shape[0]
+    out = np.empty_like(close)
+    out[:min(period, n)] = np.nan
+    if n <= period:
+        return out
+
+    # Seed Wilder's averages with the simple mean of the first `period` changes
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = close[i] - close[i - 1]
+        avg_gain += max(change, 0.0)
+        avg_loss += max(-change, 0.0)
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period, n):
+        if i > period:
+            change = close[i] - close[i - 1]
+            avg_gain = (avg_gain * (period - 1) + max(change, 0.0)) / period
+            avg_loss = (avg_loss * (period - 1) + max(-change, 0.0)) / period
+        total = avg_gain + avg_loss
+        if total == 0.0:
+            # No movement at all leaves RSI undefined
+            out[i] = np.nan
+        else:
+            # Same as 100 - 100 / (1 + gain / loss), with one division
+            out[i] = 100.0 * avg_gain / total
+    return out
+
+def calculate_rsi(close: np.ndarray, periods=14) -> np.ndarray:
+    # The Wilder recursion accumulates, so run it in float64 whatever the input
+    close = close.astype(np.float64)
+    if _HAS_TALIB:
+        rsi = talib.RSI(close, timeperiod=int(periods))
+        # TA-Lib reports 0 while every change so far is zero; match the kernel's NaN
+        flat = np.concatenate(([True], np.cumsum(np.diff(close) != 0) == 0))
+        rsi[flat] = np.nan
+        return rsi
+    return _rsi_numba(close, int(periods))
@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+
+@dataclass
+class Bundle:
+    date: np.ndarray
+    close: np.ndarray
+    vol: np.ndarray
+    ma_s: np.ndarray
+    ma_l: np.ndarray
+    rsi: np.ndarray
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            'Date': self.date,
+            'Close': self.close,
+            'Volume': self.vol,
+            'MA_Short': self.ma_s,
+            'MA_Long': self.ma_l,
+            'RSI': self.rsi,
+        })
+
+class NoDataError(Exception):
+    pass
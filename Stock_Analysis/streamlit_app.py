@@ -4,6 +4,18 @@ import yfinance as yf
 import plotly.graph_objects as go
 import numpy as np
 from datetime import datetime
+from display import (
+    TREND_LABELS, TREND_COLORS, RSI_LABELS, RSI_COLORS,
+    PRICE_LAYOUT, RSI_LAYOUT, VOL_LAYOUT,
+)
+from indicators import moving_average, calculate_rsi
+from models import Bundle, NoDataError
+
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+    _HAS_TSDOWNSAMPLE = True
+except ImportError:
+    _HAS_TSDOWNSAMPLE = False
 
 st.set_page_config(
     page_title="Stock Analysis",
@@ -54,12 +66,42 @@ st.markdown("""
 ###########################
 # Auxiliary Functions
 ###########################
-def calculate_rsi(data, periods=14):
-    delta = data['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=periods).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=periods).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
+# Raising keeps empty results (bad symbol, network error, rate limit) out of the cache
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_history(ticker: str, start, end) -> pd.DataFrame:
+    data = yf.download(ticker, start=start, end=end, progress=False)
+    if data.empty:
+        raise NoDataError(ticker)
+    # The RSI recursion would carry a missing close into every later value
+    data = data[data['Close'].notna().to_numpy().ravel()]
+    if data.empty:
+        raise NoDataError(ticker)
+    # Newer yfinance returns (field, ticker) columns, so flatten each field to 1-D
+    return pd.DataFrame({
+        'Date': data.index.to_numpy(),
+        'Close': data['Close'].to_numpy(np.float32).ravel(),
+        'Volume': data['Volume'].fillna(0).to_numpy(np.int64).ravel(),
+    })
+
+# Keyed on the arrays, so the DataFrame is only built when the cache misses
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(date: np.ndarray, close: np.ndarray, vol: np.ndarray,
+                 ma_s: np.ndarray, ma_l: np.ndarray, rsi: np.ndarray) -> bytes:
+    df = Bundle(date, close, vol, ma_s, ma_l, rsi).to_frame()
+    return df.to_csv(index=False).encode('utf-8')
+
+def downsample_index(values: np.ndarray, n_out=1000, threshold=2000) -> np.ndarray:
+    if not _HAS_TSDOWNSAMPLE or values.shape[0] <= threshold:
+        return np.arange(values.shape[0])
+    return MinMaxLTTBDownsampler().downsample(values, n_out=n_out)
+
+@st.cache_data(show_spinner=False)
+def compute_indicators(close: np.ndarray, ma_short: int, ma_long: int) -> dict:
+    return {
+        'MA_Short': moving_average(close, ma_short).astype(close.dtype, copy=False),
+        'MA_Long': moving_average(close, ma_long).astype(close.dtype, copy=False),
+        'RSI': calculate_rsi(close).astype(close.dtype, copy=False),
+    }
 
 ###########################
 # Sidebar Parameters
@@ -74,20 +116,20 @@ with st.sidebar:
     
     if st.button("Start Analysis", type="primary", use_container_width=True):
         try:
-            data = yf.download(ticker, start=start_date, end=end_date)
-            if data.empty:
-                st.error("No data found. Please enter a valid symbol.")
-            else:
-                data = data.reset_index()
-                data_new = data[['Date', 'Close', 'Volume']].copy()
-                data_new.columns = ['Date', 'Close', 'Volume']
-                data_new['Date'] = pd.to_datetime(data_new['Date'])
-                
-                data_new['MA_Short'] = data_new['Close'].rolling(ma_short).mean()
-                data_new['MA_Long'] = data_new['Close'].rolling(ma_long).mean()
-                data_new['RSI'] = calculate_rsi(data_new)
-                
-                st.session_state.data = data_new
+            data_new = fetch_history(ticker, start_date, end_date)
+            close = data_new['Close'].to_numpy()
+            indicators = compute_indicators(close, int(ma_short), int(ma_long))
+            
+            st.session_state.bundle = Bundle(
+                date=data_new['Date'].to_numpy(),
+                close=close,
+                vol=data_new['Volume'].to_numpy(),
+                ma_s=indicators['MA_Short'],
+                ma_l=indicators['MA_Long'],
+                rsi=indicators['RSI'],
+            )
+        except NoDataError:
+            st.error("No data found. Please enter a valid symbol.")
         except Exception as e:
             st.error(f"An error occurred: {str(e)}")
 
@@ -108,46 +150,42 @@ Aselsan is a leading Turkish defense electronics company, established in 1975. I
 ###########################
 # Technical Analysis Dashboard
 ###########################
-if 'data' in st.session_state:
-    data_new = st.session_state.data
+if 'bundle' in st.session_state:
+    b = st.session_state.bundle
+    idx = downsample_index(b.close)
+    plot_date = b.date[idx]
 
     row1_col1, row1_col2 = st.columns(2)
     
     with row1_col1:
         fig_price = go.Figure()
-        fig_price.add_trace(go.Scatter(
-            x=data_new['Date'],
-            y=data_new['Close'],
+        fig_price.add_trace(go.Scattergl(
+            x=plot_date,
+            y=b.close[idx],
             name='Close',
-            line=dict(color='#3498db'),
-            fill='tozeroy',  # Fill to the x-axis
-            fillcolor='rgba(52, 152, 219, 0.2)'  # Light blue fill
+            line=dict(color='#3498db')
         ))
-        fig_price.add_trace(go.Scatter(
-            x=data_new['Date'],
-            y=data_new['MA_Short'],
+        fig_price.add_trace(go.Scattergl(
+            x=plot_date,
+            y=b.ma_s[idx],
             name=f'{ma_short} Day MA',
             line=dict(color='#e74c3c', dash='dot')
         ))
-        fig_price.add_trace(go.Scatter(
-            x=data_new['Date'],
-            y=data_new['MA_Long'],
+        fig_price.add_trace(go.Scattergl(
+            x=plot_date,
+            y=b.ma_l[idx],
             name=f'{ma_long} Day MA',
             line=dict(color='#2ecc71', dash='dot')
         ))
-        fig_price.update_layout(
-            title='Closing Price and Moving Averages',
-            xaxis_title='Date',
-            yaxis_title='Price (TL)',
-            template='plotly_white'
-        )
+        fig_price.update_layout(**PRICE_LAYOUT)
         st.plotly_chart(fig_price, use_container_width=True)
 
-        latest_price = data_new['Close'].iloc[-1]
-        ma_short_value = data_new['MA_Short'].iloc[-1]
-        ma_long_value = data_new['MA_Long'].iloc[-1]
-        trend = "Rise" if ma_short_value > ma_long_value else "Drop"
-        trend_color = "#27ae60" if ma_short_value > ma_long_value else "#e74c3c"
+        latest_price = float(b.close[-1])
+        ma_short_value = float(b.ma_s[-1])
+        ma_long_value = float(b.ma_l[-1])
+        trend_sign = int(ma_short_value > ma_long_value)
+        trend = TREND_LABELS[trend_sign]
+        trend_color = TREND_COLORS[trend_sign]
         st.markdown(f"""
         <div class="info-card">
             <h3>📈 Latest Price Information</h3>
@@ -161,28 +199,23 @@ if 'data' in st.session_state:
     
     with row1_col2:
         fig_rsi = go.Figure()
-        fig_rsi.add_trace(go.Scatter(
-            x=data_new['Date'],
-            y=data_new['RSI'],
+        fig_rsi.add_trace(go.Scattergl(
+            x=plot_date,
+            y=b.rsi[idx],
             name='RSI',
             line=dict(color='#9b59b6'),
             fill='tozeroy',  # Fill to the x-axis
             fillcolor='rgba(155, 89, 182, 0.2)'  # Light purple fill
         ))
-        fig_rsi.update_layout(
-            title='Relative Strength Index (RSI)',
-            yaxis_range=[0, 100],
-            xaxis_title='Date',
-            yaxis_title='RSI',
-            template='plotly_white'
-        )
+        fig_rsi.update_layout(**RSI_LAYOUT)
         fig_rsi.add_hrect(y0=70, y1=100, line_width=0, fillcolor="red", opacity=0.1)
         fig_rsi.add_hrect(y0=0, y1=30, line_width=0, fillcolor="green", opacity=0.1)
         st.plotly_chart(fig_rsi, use_container_width=True)
         
-        latest_rsi = data_new['RSI'].iloc[-1]
-        rsi_status = "Overbought" if latest_rsi > 70 else ("Oversold" if latest_rsi < 30 else "Normal")
-        rsi_color = "#e74c3c" if latest_rsi > 70 else ("#27ae60" if latest_rsi < 30 else "#2c3e50")
+        latest_rsi = float(b.rsi[-1])
+        rsi_bucket = 0 if latest_rsi > 70 else (2 if latest_rsi < 30 else 1)
+        rsi_status = RSI_LABELS[rsi_bucket]
+        rsi_color = RSI_COLORS[rsi_bucket]
         st.markdown(f"""
         <div class="info-card">
             <h3>💹 RSI Status</h3>
@@ -198,27 +231,21 @@ if 'data' in st.session_state:
     st.subheader("📊 Volume Analysis")
     fig_volume = go.Figure()
     fig_volume.add_trace(go.Bar(
-        x=data_new['Date'],
-        y=data_new['Volume'],
+        x=plot_date,
+        y=b.vol[idx],
         name='Volume',
         marker_color='#7f8c8d'
     ))
-    fig_volume.update_layout(
-        title='Trading Volume Over Time',
-        xaxis_title='Date',
-        yaxis_title='Volume',
-        template='plotly_white'
-    )
+    fig_volume.update_layout(**VOL_LAYOUT)
     st.plotly_chart(fig_volume, use_container_width=True)
 
     ###########################
     # Download Data
     ###########################
     st.subheader("📥 Download Data")
-    csv = data_new.to_csv(index=False).encode('utf-8')
     st.download_button(
         label="Download data as CSV",
-        data=csv,
+        data=to_csv_bytes(b.date, b.close, b.vol, b.ma_s, b.ma_l, b.rsi),
         file_name=f'{ticker}_data.csv',
         mime='text/csv',
     )